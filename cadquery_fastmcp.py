@@ -1,16 +1,32 @@
 # cadquery_fastmcp.py
 from mcp.server.fastmcp import FastMCP, Context, Image
 import os
+import asyncio
 import sys
 import tempfile
 import json
 import base64
+import functools
+import hashlib
+import inspect
+import mmap
+import re
+import shutil
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Optional, Dict, List, Any, Union
 # At the top of your cadquery_fastmcp.py file, import the bridge
 from cq_editor_bridge import CQEditorBridge, integrate_with_mcp_server
 
 
 
+# Prefer orjson for serializing resources; fall back to the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Try to import CadQuery
 try:
     import cadquery as cq
@@ -20,39 +36,362 @@ except ImportError:
     CADQUERY_AVAILABLE = False
     print("CadQuery not found. Running in mock mode.")
 
+class CQObject:
+    """A named object stored in a workspace
+    
+    Attributes:
+        type: Kind of object ('box', 'cylinder', 'boolean', 'script')
+        params: Parameters the object was created from
+        workplane: CadQuery workplane holding the geometry (None in mock mode)
+        cache_key: Geometry cache key, or None if the geometry isn't cacheable
+        stl_path: Path of the object's STL export, if any
+        stl_future: Pending background STL export, if any
+        step_path: Path of the object's most recent STEP export, if any
+    """
+    __slots__ = ("type", "params", "workplane", "cache_key",
+                 "stl_path", "stl_future", "step_path")
+    
+    def __init__(self, type: str, params: dict, workplane=None, cache_key: Optional[str] = None):
+        self.type = type
+        self.params = params
+        self.workplane = workplane
+        self.cache_key = cache_key
+        self.stl_path = None
+        self.stl_future = None
+        self.step_path = None
+
+# The XY plane is built once and shared. Each workplane still gets its own
+# context so tags and pending wires never leak between objects.
+if CADQUERY_AVAILABLE:
+    _XY_PLANE = cq.Plane.named("XY")
+
 # Create a temp directory for models
 temp_dir = tempfile.mkdtemp(prefix="cadquery_mcp_")
 
+# Meshing options supported by the installed CadQuery's Shape.exportStl.
+# Newer releases can mesh in parallel and take an absolute tolerance; the
+# size-scaled tolerance is only meaningful as an absolute deflection, so
+# older releases keep the exporter's default tolerance.
+_STL_DEFAULT_TOLERANCE = 0.1
+if CADQUERY_AVAILABLE:
+    _STL_MESH_OPTIONS = {
+        key: value
+        for key, value in (("ascii", False), ("relative", False), ("parallel", True))
+        if key in inspect.signature(cq.Shape.exportStl).parameters
+    }
+else:
+    _STL_MESH_OPTIONS = {}
+
+# mkstemp creates files readable only by their owner, so exports are given
+# the mode a normally created file would get under the process umask
+_umask = os.umask(0)
+os.umask(_umask)
+_EXPORT_FILE_MODE = 0o666 & ~_umask
+
+def _atomic_write(path: str, write):
+    """Write a file via a temporary sibling file and rename it into place
+    
+    A failed write never leaves a truncated file at the destination path,
+    and readers always see either the previous file or the complete new one.
+    
+    Args:
+        path: Destination path
+        write: Callable that writes the file to the temp path it is given
+    """
+    directory, filename = os.path.split(path)
+    # Stage next to the destination (even for bare relative names) so the
+    # rename never crosses filesystems
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{filename}.", suffix=".tmp", dir=directory or os.curdir)
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.chmod(tmp_path, _EXPORT_FILE_MODE)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def _atomic_export(shape, path: str, *args, **kwargs):
+    """Export a shape atomically with exporters.export
+    
+    Arguments after the path are passed through to exporters.export, so the
+    export type must be given explicitly.
+    """
+    _atomic_write(path, lambda tmp_path: exporters.export(shape, tmp_path, *args, **kwargs))
+
+def _to_shape(shape):
+    """Convert a workplane to a compound of its shapes; shapes pass through"""
+    if isinstance(shape, cq.Workplane):
+        return cq.Compound.makeCompound(
+            [v for v in shape.vals() if isinstance(v, cq.Shape)]
+        )
+    return shape
+
+def _stl_tolerance(shape) -> float:
+    """Pick an absolute linear meshing tolerance scaled to the shape size"""
+    try:
+        diagonal = shape.BoundingBox().DiagonalLength
+    except Exception:
+        return 1e-3
+    return max(diagonal * 1e-3, 1e-4)
+
+def _export_stl(shape, path: str, tolerance: float = None, angular_tolerance: float = 0.1):
+    """Export a shape to a binary STL file
+    
+    Args:
+        shape: CadQuery object to export
+        path: Destination STL path
+        tolerance: Linear meshing tolerance (optional, scaled to the shape by
+            default when the absolute tolerance is supported)
+        angular_tolerance: Angular meshing tolerance in radians
+    """
+    shape = _to_shape(shape)
+    if tolerance is None:
+        if "relative" in _STL_MESH_OPTIONS:
+            tolerance = _stl_tolerance(shape)
+        else:
+            tolerance = _STL_DEFAULT_TOLERANCE
+    
+    _atomic_write(
+        path,
+        lambda tmp_path: shape.exportStl(
+            tmp_path, tolerance, angular_tolerance, **_STL_MESH_OPTIONS
+        )
+    )
+
+# Cache of exported STL files keyed by a hash of the parameters that produced
+# the geometry, so identical shapes are only tessellated once. Cached files
+# live in their own directory and are hard-linked to each object's path;
+# exports always replace files rather than rewriting them, so a later export
+# under the same object name can't alter the cached copy.
+STL_CACHE_SIZE = 64
+_stl_cache = OrderedDict()
+_stl_cache_dir = os.path.join(temp_dir, "stl_cache")
+_stl_cache_lock = threading.Lock()
+# Striped locks so two exports of the same geometry never mesh concurrently
+_stl_key_locks = [threading.Lock() for _ in range(32)]
+
+def _geometry_key(*parts) -> str:
+    """Build a cache key from the parameters that define a shape"""
+    return hashlib.sha1(":".join(str(p) for p in parts).encode()).hexdigest()
+
+def _export_stl_cached(shape, stl_path: str, key: Optional[str]):
+    """Export a shape to STL, reusing a previous export with the same key
+    
+    Args:
+        shape: CadQuery object to export
+        stl_path: Destination STL path
+        key: Geometry cache key, or None to always export
+    """
+    if key is None:
+        _export_stl(shape, stl_path)
+        return
+    
+    with _stl_key_locks[int(key[:8], 16) % len(_stl_key_locks)]:
+        with _stl_cache_lock:
+            cached = _stl_cache.get(key)
+            if cached is not None and os.path.exists(cached):
+                _stl_cache.move_to_end(key)
+                _link_or_copy(cached, stl_path)
+                return
+        
+        os.makedirs(_stl_cache_dir, exist_ok=True)
+        cached = os.path.join(_stl_cache_dir, f"{key}.stl")
+        _export_stl(shape, cached)
+        
+        with _stl_cache_lock:
+            _stl_cache[key] = cached
+            while len(_stl_cache) > STL_CACHE_SIZE:
+                _, evicted = _stl_cache.popitem(last=False)
+                if os.path.exists(evicted):
+                    os.remove(evicted)
+            _link_or_copy(cached, stl_path)
+
+# Placeholder file contents used in mock mode
+_MOCK_STL = b"Mock STL file content"
+_MOCK_SCRIPT_STL = b"Mock STL file content from script"
+_MOCK_PNG = b"Mock PNG content"
+
+def _write_mock(path: str, payload: bytes):
+    """Write a mock output file with a single unbuffered write"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+
+def _link_or_copy(src: str, dst: str):
+    """Hard-link src to dst, copying instead where links aren't supported"""
+    if os.path.exists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+def _encode_png(path: str) -> str:
+    """Base64-encode an image file without first reading it into memory"""
+    if os.path.getsize(path) == 0:
+        return ""
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return base64.b64encode(data).decode("ascii")
+
+@functools.lru_cache(maxsize=256)
+def _compile_script(script: str):
+    """Compile a CadQuery script, reusing the code object for repeat scripts"""
+    return compile(script, "<cq-script>", "exec")
+
+# Scripts can run OCCT operations for seconds, so they execute on worker
+# threads to keep the server's event loop responsive
+_script_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cq_script")
+
+def _run_script(script: str) -> dict:
+    """Execute a CadQuery script and return its local scope"""
+    # Create a local scope with CadQuery module
+    local_scope = {"cq": cq}
+    exec(_compile_script(script), {}, local_scope)
+    return local_scope
+
+# STL tessellation runs in the background so constructive tools return
+# immediately; consumers of the file call _await_stl first
+_stl_pool = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="cq_stl")
+
+_stl_pending = {}
+_stl_pending_lock = threading.Lock()
+
+def _submit_stl(obj: CQObject, shape, stl_path: str, key: Optional[str] = None):
+    """Schedule a background STL export and record it on the object
+    
+    Exports to the same path (an object re-created under an existing name)
+    are serialized so the newest geometry always lands last.
+    """
+    with _stl_pending_lock:
+        previous = _stl_pending.get(stl_path)
+        
+        def run():
+            if previous is not None:
+                wait([previous])
+            _export_stl_cached(shape, stl_path, key)
+        
+        future = _stl_pool.submit(run)
+        _stl_pending[stl_path] = future
+    
+    def forget(f):
+        with _stl_pending_lock:
+            if _stl_pending.get(stl_path) is f:
+                del _stl_pending[stl_path]
+    
+    future.add_done_callback(forget)
+    
+    obj.stl_path = stl_path
+    obj.stl_future = future
+
+def _await_stl(obj: CQObject) -> Optional[str]:
+    """Wait for an object's pending STL export and return its path
+    
+    Returns None if the object has no STL export or the background export
+    failed, so the caller can export it again itself.
+    """
+    if obj.stl_future is not None:
+        try:
+            obj.stl_future.result()
+        except Exception as e:
+            # stdout carries the stdio transport's JSON-RPC stream
+            print(f"Background STL export failed: {str(e)}", file=sys.stderr)
+            return None
+    return obj.stl_path
+
+def _wait_for_meshing():
+    """Wait until no background STL export is meshing
+    
+    Meshing writes triangulations into the shapes' faces, and boolean results
+    share untouched faces with their inputs (even inputs that were never
+    meshed themselves because their STL came from the cache), so shapes must
+    not be used on another thread while any export is in flight.
+    """
+    with _stl_pending_lock:
+        pending = list(_stl_pending.values())
+    wait(pending)
+
 # Create the MCP server
 mcp = FastMCP("CadQuery", 
              dependencies=["cadquery", "numpy"])
 
-# Store for CadQuery workspaces and objects
+# Store for CadQuery workspaces and objects. Objects are kept in LRU order
+# and the least recently used are evicted beyond MAX_OBJECTS per workspace,
+# since each one holds live OCCT shapes.
+MAX_OBJECTS = 256
 workspaces = {}
 current_workspace_id = "default"
 
-# Initialize default workspace
-if CADQUERY_AVAILABLE:
-    workspaces[current_workspace_id] = {
-        "objects": {},
-        "assembly": cq.Assembly(),
-        "current_object": None
-    }
-else:
-    # Mock workspace when CadQuery is not available
-    workspaces[current_workspace_id] = {
-        "objects": {},
+_UNSAFE_PATH_CHARS_RE = re.compile(r"[^\w.-]")
+_STEP_SUFFIX_RE = re.compile(r"\.(step|stp)$", re.IGNORECASE)
+
+def _new_workspace(name: str) -> dict:
+    """Create an empty workspace with its own temp subdirectory for exports"""
+    safe_name = _UNSAFE_PATH_CHARS_RE.sub("_", name)
+    workspace_dir = tempfile.mkdtemp(prefix=f"cq_{safe_name}_", dir=temp_dir)
+    return {
+        "objects": OrderedDict(),
+        # No tool uses assemblies yet; building an OCCT XDE document for every
+        # workspace is expensive, so create one only when something needs it
         "assembly": None,
-        "current_object": None
+        "current_object": None,
+        "counters": Counter(),
+        "temp_dir": workspace_dir,
+        # Output paths are built by concatenation on this prefix
+        "path_prefix": workspace_dir + os.sep
     }
 
+# Initialize default workspace
+workspaces[current_workspace_id] = _new_workspace(current_workspace_id)
+
 def get_current_workspace():
     """Helper to get the current workspace"""
     return workspaces[current_workspace_id]
 
+def _store_object(workspace: dict, name: str, obj: CQObject):
+    """Add an object to a workspace, evicting the least recently used
+    objects once the workspace holds MAX_OBJECTS
+    """
+    objects = workspace["objects"]
+    if name in objects:
+        _release_object(objects.pop(name))
+    while len(objects) >= MAX_OBJECTS:
+        evicted_name, evicted = objects.popitem(last=False)
+        _release_object(evicted)
+        if workspace["current_object"] == evicted_name:
+            workspace["current_object"] = None
+    objects[name] = obj
+
+def _release_object(obj: CQObject):
+    """Drop an object's geometry so OCCT can free the underlying shapes"""
+    if obj.stl_future is not None:
+        obj.stl_future.cancel()
+    obj.workplane = None
+
+def _next_object_name(workspace: dict, prefix: str) -> str:
+    """Generate a default object name that is unique within the workspace
+    
+    Uses a per-workspace counter, so names are never reused even after
+    objects are removed or explicitly named to look like generated ones.
+    """
+    counters = workspace["counters"]
+    while True:
+        name = f"{prefix}_{counters[prefix]}"
+        counters[prefix] += 1
+        if name not in workspace["objects"]:
+            return name
+
+def next_current_object_name(prefix: str) -> str:
+    """Generate a default object name that is unique within the current workspace"""
+    return _next_object_name(get_current_workspace(), prefix)
+
 # Move bridge integration here, after the function is defined
 
-bridge = integrate_with_mcp_server(mcp, get_current_workspace)
+bridge = integrate_with_mcp_server(mcp, get_current_workspace, next_current_object_name)
 
 @mcp.resource("workspace://current")
 def get_current_workspace_info() -> str:
@@ -66,6 +405,8 @@ def get_current_workspace_info() -> str:
         "current_object": workspace["current_object"]
     }
     
+    if orjson is not None:
+        return orjson.dumps(info, option=orjson.OPT_INDENT_2).decode()
     return json.dumps(info, indent=2)
 
 @mcp.tool()
@@ -83,18 +424,7 @@ def create_workspace(name: str) -> dict:
             "message": f"Workspace '{name}' already exists"
         }
     
-    if CADQUERY_AVAILABLE:
-        workspaces[name] = {
-            "objects": {},
-            "assembly": cq.Assembly(),
-            "current_object": None
-        }
-    else:
-        workspaces[name] = {
-            "objects": {},
-            "assembly": None,
-            "current_object": None
-        }
+    workspaces[name] = _new_workspace(name)
     
     current_workspace_id = name
     
@@ -127,6 +457,42 @@ def switch_workspace(name: str) -> dict:
         "workspace_id": name
     }
 
+@mcp.tool()
+def delete_workspace(name: str) -> dict:
+    """Delete a workspace, its objects and its exported files
+    
+    Args:
+        name: Name of the workspace to delete
+    """
+    global current_workspace_id
+    
+    if name not in workspaces:
+        return {
+            "status": "error",
+            "message": f"Workspace '{name}' does not exist"
+        }
+    
+    if name == "default":
+        return {
+            "status": "error",
+            "message": "The default workspace cannot be deleted"
+        }
+    
+    workspace = workspaces.pop(name)
+    for obj in workspace["objects"].values():
+        if obj.stl_future is not None:
+            obj.stl_future.cancel()
+    shutil.rmtree(workspace["temp_dir"], ignore_errors=True)
+    
+    if current_workspace_id == name:
+        current_workspace_id = "default"
+    
+    return {
+        "status": "success",
+        "message": f"Deleted workspace: {name}",
+        "workspace_id": current_workspace_id
+    }
+
 @mcp.tool()
 def get_workspace_info() -> dict:
     """Get detailed information about the current design workspace"""
@@ -137,7 +503,7 @@ def get_workspace_info() -> dict:
         "object_count": len(workspace["objects"]),
         "objects": list(workspace["objects"].keys()),
         "current_object": workspace["current_object"],
-        "temp_directory": temp_dir
+        "temp_directory": workspace["temp_dir"]
     }
 
 @mcp.tool()
@@ -155,48 +521,44 @@ def create_box(width: float = 1.0, length: float = 1.0, height: float = 1.0,
     workspace = get_current_workspace()
     
     if name is None:
-        name = f'box_{len(workspace["objects"])}'
+        name = _next_object_name(workspace, "box")
     
     if CADQUERY_AVAILABLE:
         # Create real CadQuery box
-        box = cq.Workplane("XY")
+        box = cq.Workplane(_XY_PLANE)
         if centered:
             box = box.box(width, length, height)
         else:
             box = box.box(width, length, height, centered=False)
         
         # Store in workspace
-        workspace["objects"][name] = {
-            'type': 'box',
-            'width': width,
-            'length': length,
-            'height': height,
-            'centered': centered,
-            'workplane': box
-        }
+        obj = CQObject(
+            'box',
+            {'width': width, 'length': length, 'height': height, 'centered': centered},
+            workplane=box,
+            cache_key=_geometry_key("box", width, length, height, centered)
+        )
+        _store_object(workspace, name, obj)
         
         # Set as current object
         workspace["current_object"] = name
         
-        # Export to STL
-        stl_path = os.path.join(temp_dir, f"{name}.stl")
-        exporters.export(box, stl_path)
+        # Export to STL in the background
+        stl_path = f'{workspace["path_prefix"]}{name}.stl'
+        _submit_stl(obj, box, stl_path, obj.cache_key)
     else:
         # Mock implementation
-        workspace["objects"][name] = {
-            'type': 'box',
-            'width': width,
-            'length': length,
-            'height': height,
-            'centered': centered
-        }
+        obj = CQObject(
+            'box',
+            {'width': width, 'length': length, 'height': height, 'centered': centered}
+        )
+        _store_object(workspace, name, obj)
         
         workspace["current_object"] = name
         
         # Create a mock file path
-        stl_path = os.path.join(temp_dir, f"{name}.stl")
-        with open(stl_path, 'w') as f:
-            f.write("Mock STL file content")
+        stl_path = f'{workspace["path_prefix"]}{name}.stl'
+        _write_mock(stl_path, _MOCK_STL)
     
     return {
         "status": "success",
@@ -226,42 +588,40 @@ def create_cylinder(radius: float = 1.0, height: float = 1.0,
     workspace = get_current_workspace()
     
     if name is None:
-        name = f'cylinder_{len(workspace["objects"])}'
+        name = _next_object_name(workspace, "cylinder")
     
     if CADQUERY_AVAILABLE:
         # Create real CadQuery cylinder
-        cylinder = cq.Workplane("XY").cylinder(height, radius)
+        cylinder = cq.Workplane(_XY_PLANE).cylinder(height, radius)
         
         # Store in workspace
-        workspace["objects"][name] = {
-            'type': 'cylinder',
-            'radius': radius,
-            'height': height,
-            'centered': centered,
-            'workplane': cylinder
-        }
+        obj = CQObject(
+            'cylinder',
+            {'radius': radius, 'height': height, 'centered': centered},
+            workplane=cylinder,
+            cache_key=_geometry_key("cylinder", radius, height, centered)
+        )
+        _store_object(workspace, name, obj)
         
         # Set as current object
         workspace["current_object"] = name
         
-        # Export to STL
-        stl_path = os.path.join(temp_dir, f"{name}.stl")
-        exporters.export(cylinder, stl_path)
+        # Export to STL in the background
+        stl_path = f'{workspace["path_prefix"]}{name}.stl'
+        _submit_stl(obj, cylinder, stl_path, obj.cache_key)
     else:
         # Mock implementation
-        workspace["objects"][name] = {
-            'type': 'cylinder',
-            'radius': radius,
-            'height': height,
-            'centered': centered
-        }
+        obj = CQObject(
+            'cylinder',
+            {'radius': radius, 'height': height, 'centered': centered}
+        )
+        _store_object(workspace, name, obj)
         
         workspace["current_object"] = name
         
         # Create a mock file path
-        stl_path = os.path.join(temp_dir, f"{name}.stl")
-        with open(stl_path, 'w') as f:
-            f.write("Mock STL file content")
+        stl_path = f'{workspace["path_prefix"]}{name}.stl'
+        _write_mock(stl_path, _MOCK_STL)
     
     return {
         "status": "success",
@@ -287,25 +647,30 @@ def boolean_operation(operation: str, target: str, tool: str, name: str = None)
         name: Name for the resulting object (optional)
     """
     workspace = get_current_workspace()
+    objects = workspace["objects"]
     
-    if target not in workspace["objects"]:
+    if target not in objects:
         return {
             "status": "error",
             "message": f"Target object '{target}' not found"
         }
     
-    if tool not in workspace["objects"]:
+    if tool not in objects:
         return {
             "status": "error",
             "message": f"Tool object '{tool}' not found"
         }
     
+    objects.move_to_end(target)
+    objects.move_to_end(tool)
+    
     if name is None:
-        name = f'boolean_{len(workspace["objects"])}'
+        name = _next_object_name(workspace, "boolean")
     
     if CADQUERY_AVAILABLE:
-        target_obj = workspace["objects"][target]["workplane"]
-        tool_obj = workspace["objects"][tool]["workplane"]
+        _wait_for_meshing()
+        target_obj = objects[target].workplane
+        tool_obj = objects[tool].workplane
         
         if operation == "union":
             result = target_obj.union(tool_obj)
@@ -319,36 +684,42 @@ def boolean_operation(operation: str, target: str, tool: str, name: str = None)
                 "message": f"Unknown boolean operation: {operation}"
             }
         
+        # Results are only cacheable when both inputs have known geometry
+        target_key = objects[target].cache_key
+        tool_key = objects[tool].cache_key
+        if target_key is not None and tool_key is not None:
+            cache_key = _geometry_key("boolean", operation, target_key, tool_key)
+        else:
+            cache_key = None
+        
         # Store result
-        workspace["objects"][name] = {
-            'type': 'boolean',
-            'operation': operation,
-            'target': target,
-            'tool': tool,
-            'workplane': result
-        }
+        obj = CQObject(
+            'boolean',
+            {'operation': operation, 'target': target, 'tool': tool},
+            workplane=result,
+            cache_key=cache_key
+        )
+        _store_object(workspace, name, obj)
         
         # Set as current object
         workspace["current_object"] = name
         
-        # Export to STL
-        stl_path = os.path.join(temp_dir, f"{name}.stl")
-        exporters.export(result, stl_path)
+        # Export to STL in the background
+        stl_path = f'{workspace["path_prefix"]}{name}.stl'
+        _submit_stl(obj, result, stl_path, cache_key)
     else:
         # Mock implementation
-        workspace["objects"][name] = {
-            'type': 'boolean',
-            'operation': operation,
-            'target': target,
-            'tool': tool
-        }
+        obj = CQObject(
+            'boolean',
+            {'operation': operation, 'target': target, 'tool': tool}
+        )
+        _store_object(workspace, name, obj)
         
         workspace["current_object"] = name
         
         # Create a mock file path
-        stl_path = os.path.join(temp_dir, f"{name}.stl")
-        with open(stl_path, 'w') as f:
-            f.write(f"Mock STL file for {operation} of {target} and {tool}")
+        stl_path = f'{workspace["path_prefix"]}{name}.stl'
+        _write_mock(stl_path, f"Mock STL file for {operation} of {target} and {tool}".encode())
     
     return {
         "status": "success",
@@ -359,6 +730,146 @@ def boolean_operation(operation: str, target: str, tool: str, name: str = None)
         }
     }
 
+@mcp.tool()
+def boolean_many(operation: str, target: str, tools: List[str], name: str = None) -> dict:
+    """Perform a boolean operation between one object and several others at once
+    
+    The result matches chaining boolean_operation over the tools. Union and
+    subtract pass all tools to a single OCCT boolean; intersect is applied
+    one tool at a time. Either way the result is tessellated only once.
+    
+    Args:
+        operation: Type of boolean operation ('union', 'subtract', 'intersect')
+        target: Name of the target object
+        tools: Names of the tool objects
+        name: Name for the resulting object (optional)
+    """
+    workspace = get_current_workspace()
+    objects = workspace["objects"]
+    
+    if target not in objects:
+        return {
+            "status": "error",
+            "message": f"Target object '{target}' not found"
+        }
+    
+    if not tools:
+        return {
+            "status": "error",
+            "message": "At least one tool object is required"
+        }
+    
+    for tool in tools:
+        if tool not in objects:
+            return {
+                "status": "error",
+                "message": f"Tool object '{tool}' not found"
+            }
+    
+    objects.move_to_end(target)
+    for tool in tools:
+        objects.move_to_end(tool)
+    
+    if name is None:
+        name = _next_object_name(workspace, "boolean")
+    
+    if CADQUERY_AVAILABLE:
+        _wait_for_meshing()
+        target_obj = objects[target].workplane
+        target_solid = target_obj.findSolid()
+        tool_solids = [objects[tool].workplane.findSolid() for tool in tools]
+        
+        if operation == "union":
+            shape = target_solid.fuse(*tool_solids)
+        elif operation == "subtract":
+            shape = target_solid.cut(*tool_solids)
+        elif operation == "intersect":
+            # A single Common treats the tools as one group, which would give
+            # target & (t1 | t2 ...), so intersect with each tool in turn
+            shape = target_solid
+            for tool_solid in tool_solids:
+                shape = shape.intersect(tool_solid)
+        else:
+            return {
+                "status": "error",
+                "message": f"Unknown boolean operation: {operation}"
+            }
+        
+        result = target_obj.newObject([shape.clean()])
+        
+        # Results are only cacheable when every input has known geometry
+        input_keys = [objects[target].cache_key]
+        input_keys += [objects[tool].cache_key for tool in tools]
+        if None not in input_keys:
+            cache_key = _geometry_key("boolean", operation, *input_keys)
+        else:
+            cache_key = None
+        
+        # Store result
+        obj = CQObject(
+            'boolean',
+            {'operation': operation, 'target': target, 'tools': list(tools)},
+            workplane=result,
+            cache_key=cache_key
+        )
+        _store_object(workspace, name, obj)
+        
+        # Set as current object
+        workspace["current_object"] = name
+        
+        # Export to STL in the background
+        stl_path = f'{workspace["path_prefix"]}{name}.stl'
+        _submit_stl(obj, result, stl_path, cache_key)
+    else:
+        # Mock implementation
+        obj = CQObject(
+            'boolean',
+            {'operation': operation, 'target': target, 'tools': list(tools)}
+        )
+        _store_object(workspace, name, obj)
+        
+        workspace["current_object"] = name
+        
+        # Create a mock file path
+        stl_path = f'{workspace["path_prefix"]}{name}.stl'
+        _write_mock(stl_path, f"Mock STL file for {operation} of {target} and {', '.join(tools)}".encode())
+    
+    return {
+        "status": "success",
+        "message": f"Created {operation} between {target} and {', '.join(tools)}",
+        "object_id": name,
+        "files": {
+            "stl": stl_path
+        }
+    }
+
+@mcp.tool()
+def delete_object(name: str) -> dict:
+    """Delete an object from the current workspace and release its geometry
+    
+    Args:
+        name: Name of the object to delete
+    """
+    workspace = get_current_workspace()
+    objects = workspace["objects"]
+    
+    if name not in objects:
+        return {
+            "status": "error",
+            "message": f"Object '{name}' not found"
+        }
+    
+    _release_object(objects.pop(name))
+    
+    if workspace["current_object"] == name:
+        workspace["current_object"] = None
+    
+    return {
+        "status": "success",
+        "message": f"Deleted object: {name}",
+        "object_id": name
+    }
+
 @mcp.tool()
 def render_current_object(ctx: Context) -> dict:
     """Render the current object and return an image
@@ -366,6 +877,7 @@ def render_current_object(ctx: Context) -> dict:
     This function renders the current object and returns a base64-encoded image.
     """
     workspace = get_current_workspace()
+    objects = workspace["objects"]
     
     if workspace["current_object"] is None:
         return {
@@ -374,6 +886,7 @@ def render_current_object(ctx: Context) -> dict:
         }
     
     obj_name = workspace["current_object"]
+    objects.move_to_end(obj_name)
     
     if CADQUERY_AVAILABLE:
         try:
@@ -381,20 +894,23 @@ def render_current_object(ctx: Context) -> dict:
             # For simplicity, we're returning a mock image
             ctx.info(f"Rendering {obj_name}...")
             
+            # Rendering works from the tessellated mesh
+            _await_stl(objects[obj_name])
+            
             # For actual rendering, you might use something like this:
             # from cadquery import exporters
-            # png_path = os.path.join(temp_dir, f"{obj_name}.png")
-            # exporters.export(workspace["objects"][obj_name]["workplane"], png_path)
+            # png_path = f'{workspace["path_prefix"]}{obj_name}.png'
+            # exporters.export(objects[obj_name].workplane, png_path)
             
             # Mock image for now
-            mock_image_path = os.path.join(temp_dir, f"{obj_name}.png")
-            with open(mock_image_path, "w") as f:
-                f.write("Mock PNG content")
+            mock_image_path = f'{workspace["path_prefix"]}{obj_name}.png'
+            _write_mock(mock_image_path, _MOCK_PNG)
             
             return {
                 "status": "success",
                 "message": f"Rendered {obj_name}",
                 "object_id": obj_name,
+                "image": _encode_png(mock_image_path),
                 "files": {
                     "png": mock_image_path
                 }
@@ -406,36 +922,41 @@ def render_current_object(ctx: Context) -> dict:
             }
     else:
         # Mock implementation
-        mock_image_path = os.path.join(temp_dir, f"{obj_name}.png")
-        with open(mock_image_path, "w") as f:
-            f.write("Mock PNG content")
+        mock_image_path = f'{workspace["path_prefix"]}{obj_name}.png'
+        _write_mock(mock_image_path, _MOCK_PNG)
         
         return {
             "status": "success",
             "message": f"Rendered {obj_name} (mock)",
             "object_id": obj_name,
+            "image": _encode_png(mock_image_path),
             "files": {
                 "png": mock_image_path
             }
         }
 
 @mcp.tool()
-def export_object(name: str, format: str = "stl", validate: bool = True) -> dict:
+def export_object(name: str, format: str = "stl", validate: Union[bool, str] = True) -> dict:
     """Export an object to the specified format
     
     Args:
         name: Name of the object to export
         format: Export format (stl, step, stp)
-        validate: Whether to validate the exported file (optional)
+        validate: Whether to validate the exported file (optional). STEP files
+            are checked for a plausible size; pass "strict" to also check
+            the ISO-10303 header.
     """
     workspace = get_current_workspace()
+    objects = workspace["objects"]
     
-    if name not in workspace["objects"]:
+    if name not in objects:
         return {
             "status": "error",
             "message": f"Object '{name}' not found"
         }
     
+    objects.move_to_end(name)
+    
     # Normalize the format
     format = format.lower()
     
@@ -444,23 +965,29 @@ def export_object(name: str, format: str = "stl", validate: bool = True) -> dict
     extension = format
     
     if CADQUERY_AVAILABLE:
-        obj = workspace["objects"][name]
+        obj = objects[name]
         
         # Get the workplane
-        workplane = obj.get("workplane")
+        workplane = obj.workplane
         
         # Export to the requested format
-        output_path = os.path.join(temp_dir, f"{name}.{extension}")
+        output_path = f'{workspace["path_prefix"]}{name}.{extension}'
         
         try:
+            # Exporting reads (and for STL, meshes) faces that a background
+            # export may be meshing
+            _wait_for_meshing()
+            
             if format == "stl":
-                exporters.export(workplane, output_path)
+                # Reuse the background export if it wrote to the same path
+                if _await_stl(obj) != output_path or not os.path.exists(output_path):
+                    _export_stl(workplane, output_path)
             elif is_step_format:
                 # Support both .step and .stp extensions for STEP format
                 # Make sure we're exporting a solid (not a workplane)
                 if hasattr(workplane, "val") and workplane.val and hasattr(workplane, "findSolid"):
                     solid = workplane.findSolid()
-                    exporters.export(
+                    _atomic_export(
                         solid, 
                         output_path, 
                         exporters.ExportTypes.STEP,
@@ -469,7 +996,7 @@ def export_object(name: str, format: str = "stl", validate: bool = True) -> dict
                     )
                 else:
                     # Default case for workplanes
-                    exporters.export(
+                    _atomic_export(
                         workplane, 
                         output_path, 
                         exporters.ExportTypes.STEP,
@@ -477,28 +1004,37 @@ def export_object(name: str, format: str = "stl", validate: bool = True) -> dict
                         angularTolerance=0.1
                     )
                 
-                # Validate the file if requested
+                # Validate the file if requested. The exporter either writes
+                # a complete file or raises, so a size check is normally enough.
                 if validate and is_step_format:
-                    if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
-                        # Check if file is readable by reopening it
+                    try:
+                        size = os.stat(output_path).st_size
+                    except OSError:
+                        size = 0
+                    if size < 64:
+                        return {
+                            "status": "error",
+                            "message": f"Exported file is empty, truncated or wasn't created properly"
+                        }
+                    
+                    if validate == "strict":
+                        # The STEP header is on the first line, so a small
+                        # binary read is enough to check it
                         try:
-                            with open(output_path, 'r') as f:
-                                first_line = f.readline()
-                                if not first_line or "ISO-10303" not in first_line:
-                                    return {
-                                        "status": "error",
-                                        "message": f"Exported file does not appear to be a valid STEP file"
-                                    }
+                            with open(output_path, 'rb') as f:
+                                head = f.read(128)
+                            if b"ISO-10303" not in head:
+                                return {
+                                    "status": "error",
+                                    "message": f"Exported file does not appear to be a valid STEP file"
+                                }
                         except Exception as file_error:
                             return {
                                 "status": "error",
                                 "message": f"Exported file validation failed: {str(file_error)}"
                             }
-                    else:
-                        return {
-                            "status": "error",
-                            "message": f"Exported file is empty or wasn't created properly"
-                        }
+                
+                obj.step_path = output_path
             else:
                 return {
                     "status": "error",
@@ -511,12 +1047,11 @@ def export_object(name: str, format: str = "stl", validate: bool = True) -> dict
             }
     else:
         # Mock implementation
-        output_path = os.path.join(temp_dir, f"{name}.{extension}")
-        with open(output_path, 'w') as f:
-            if is_step_format:
-                f.write(f"Mock STEP file content for {name}")
-            else:
-                f.write(f"Mock {format.upper()} file content for {name}")
+        output_path = f'{workspace["path_prefix"]}{name}.{extension}'
+        if is_step_format:
+            _write_mock(output_path, f"Mock STEP file content for {name}".encode())
+        else:
+            _write_mock(output_path, f"Mock {format.upper()} file content for {name}".encode())
     
     return {
         "status": "success",
@@ -536,32 +1071,38 @@ def export_step(name: str, filepath: str = None) -> dict:
         filepath: Optional custom filepath (if not specified, uses temp directory)
     """
     workspace = get_current_workspace()
+    objects = workspace["objects"]
     
-    if name not in workspace["objects"]:
+    if name not in objects:
         return {
             "status": "error",
             "message": f"Object '{name}' not found"
         }
     
+    objects.move_to_end(name)
+    
     # Determine output path
     if filepath:
         # Ensure the filepath ends with .step or .stp
-        if not (filepath.lower().endswith('.step') or filepath.lower().endswith('.stp')):
+        if not _STEP_SUFFIX_RE.search(filepath):
             filepath += '.step'
         output_path = filepath
     else:
-        output_path = os.path.join(temp_dir, f"{name}.step")
+        output_path = f'{workspace["path_prefix"]}{name}.step'
     
     if CADQUERY_AVAILABLE:
         try:
-            obj = workspace["objects"][name]
-            workplane = obj.get("workplane")
+            obj = objects[name]
+            workplane = obj.workplane
+            
+            # Don't read faces a background export may be meshing
+            _wait_for_meshing()
             
             # Export to STEP format with more options
             # Make sure we're exporting a solid (not a workplane)
             if hasattr(workplane, "val") and workplane.val and hasattr(workplane, "findSolid"):
                 solid = workplane.findSolid()
-                exporters.export(
+                _atomic_export(
                     solid, 
                     output_path, 
                     exporters.ExportTypes.STEP,
@@ -570,17 +1111,21 @@ def export_step(name: str, filepath: str = None) -> dict:
                 )
             else:
                 # Default case for workplanes
-                exporters.export(
+                _atomic_export(
                     workplane, 
                     output_path, 
                     exporters.ExportTypes.STEP,
                     tolerance=0.001,
                     angularTolerance=0.1
                 )
+            obj.step_path = output_path
             
-            # Also create a preview STL file for visualization
-            stl_path = os.path.join(temp_dir, f"{name}.stl")
-            exporters.export(workplane, stl_path)
+            # Also provide a preview STL file for visualization, reusing the
+            # object's existing export instead of tessellating a second time
+            stl_path = f'{workspace["path_prefix"]}{name}.stl'
+            if _await_stl(obj) != stl_path or not os.path.exists(stl_path):
+                _export_stl(workplane, stl_path)
+                obj.stl_path = stl_path
             
         except Exception as e:
             return {
@@ -589,14 +1134,12 @@ def export_step(name: str, filepath: str = None) -> dict:
             }
     else:
         # Mock implementation
-        output_path = output_path or os.path.join(temp_dir, f"{name}.step")
-        with open(output_path, 'w') as f:
-            f.write(f"Mock STEP file content for {name}")
+        output_path = output_path or f'{workspace["path_prefix"]}{name}.step'
+        _write_mock(output_path, f"Mock STEP file content for {name}".encode())
         
         # Mock STL file
-        stl_path = os.path.join(temp_dir, f"{name}.stl")
-        with open(stl_path, 'w') as f:
-            f.write(f"Mock STL file content for {name}")
+        stl_path = f'{workspace["path_prefix"]}{name}.stl'
+        _write_mock(stl_path, f"Mock STL file content for {name}".encode())
     
     return {
         "status": "success",
@@ -609,7 +1152,7 @@ def export_step(name: str, filepath: str = None) -> dict:
     }
 
 @mcp.tool()
-def execute_cq_script(script: str, name: str = None) -> dict:
+async def execute_cq_script(script: str, name: str = None) -> dict:
     """Execute a CadQuery script and store the resulting object
     
     Args:
@@ -619,15 +1162,13 @@ def execute_cq_script(script: str, name: str = None) -> dict:
     workspace = get_current_workspace()
     
     if name is None:
-        name = f'script_{len(workspace["objects"])}'
+        name = _next_object_name(workspace, "script")
     
     if CADQUERY_AVAILABLE:
         try:
-            # Create a local scope with CadQuery module
-            local_scope = {"cq": cq}
-            
-            # Execute the script
-            exec(script, {}, local_scope)
+            # Execute the script off the event loop
+            loop = asyncio.get_running_loop()
+            local_scope = await loop.run_in_executor(_script_pool, _run_script, script)
             
             # Get the result (assume it's stored in a variable called 'result')
             if "result" not in local_scope:
@@ -639,18 +1180,19 @@ def execute_cq_script(script: str, name: str = None) -> dict:
             result = local_scope["result"]
             
             # Store in workspace
-            workspace["objects"][name] = {
-                'type': 'script',
-                'script': script,
-                'workplane': result
-            }
+            obj = CQObject(
+                'script',
+                {'script': script},
+                workplane=result
+            )
+            _store_object(workspace, name, obj)
             
             # Set as current object
             workspace["current_object"] = name
             
-            # Export to STL
-            stl_path = os.path.join(temp_dir, f"{name}.stl")
-            exporters.export(result, stl_path)
+            # Export to STL in the background
+            stl_path = f'{workspace["path_prefix"]}{name}.stl'
+            _submit_stl(obj, result, stl_path)
             
             return {
                 "status": "success",
@@ -667,17 +1209,17 @@ def execute_cq_script(script: str, name: str = None) -> dict:
             }
     else:
         # Mock implementation
-        workspace["objects"][name] = {
-            'type': 'script',
-            'script': script
-        }
+        obj = CQObject(
+            'script',
+            {'script': script}
+        )
+        _store_object(workspace, name, obj)
         
         workspace["current_object"] = name
         
         # Create a mock file path
-        stl_path = os.path.join(temp_dir, f"{name}.stl")
-        with open(stl_path, 'w') as f:
-            f.write("Mock STL file content from script")
+        stl_path = f'{workspace["path_prefix"]}{name}.stl'
+        _write_mock(stl_path, _MOCK_SCRIPT_STL)
         
         return {
             "status": "success",
@@ -1,37 +1,156 @@
 # cq_editor_bridge.py
+import asyncio
+import atexit
+import itertools
 import os
+import selectors
+import shutil
 import sys
 import tempfile
-import json
 import subprocess
 import threading
 import time
-from pathlib import Path
-from typing import Optional, Dict, Any, Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Optional, Dict, Any, Callable, List, Set, Tuple
+
+# Minimum free space required before placing temp files on /dev/shm
+_MIN_SHM_FREE_BYTES = 256 * 1024 * 1024
+
+def _temp_parent_dir() -> Optional[str]:
+    """Pick the parent directory for the bridge's temp files
+    
+    Honors the CADQUERY_MCP_TMPDIR environment variable (creating the
+    directory if needed), otherwise prefers the RAM-backed /dev/shm when it
+    is writable and has room, and falls back to the system default temp
+    location (None).
+    """
+    override = os.environ.get("CADQUERY_MCP_TMPDIR")
+    if override:
+        try:
+            os.makedirs(override, exist_ok=True)
+            return override
+        except OSError as e:
+            # The bridge is created at server import, so never fail here
+            print(f"Can't use CADQUERY_MCP_TMPDIR={override}: {str(e)}", file=sys.stderr)
+            return None
+    
+    shm = "/dev/shm"
+    try:
+        st = os.statvfs(shm)
+    except (AttributeError, OSError):
+        return None
+    if os.access(shm, os.W_OK) and st.f_bavail * st.f_frsize >= _MIN_SHM_FREE_BYTES:
+        return shm
+    return None
+
+def _build_launch_candidates() -> List[Tuple[List[str], bool]]:
+    """Work out the commands that might start CQ-Editor on this platform
+    
+    Returns:
+        list: (argv, pass_script) pairs in order of preference, where
+            pass_script says whether the script file should be appended
+    """
+    candidates = []
+    
+    # Default in PATH
+    cq_editor = shutil.which("cq-editor")
+    if cq_editor:
+        candidates.append(([cq_editor], True))
+    
+    if sys.platform == "win32":
+        # Windows conda/pip install
+        candidates.append(([os.path.join(sys.exec_prefix, 'Scripts', 'cq-editor.exe')], True))
+        # Python executable for module approach
+        candidates.append(([os.path.join(sys.exec_prefix, 'python.exe'), "-m", "cq_editor"], False))
+        # Your specific environment
+        own_env = r"C:\Users\Senthil\miniconda3\envs\cadquery\python.exe"
+        if os.path.exists(own_env):
+            candidates.append(([own_env, "-m", "cq_editor"], False))
+    else:
+        candidates.append(([sys.executable, "-m", "cq_editor"], False))
+    
+    return candidates
+
+# Computed once, since neither the platform nor the environment changes
+_LAUNCH_CANDIDATES = _build_launch_candidates()
 
 class CQEditorBridge:
     """Bridge class to communicate with cq-editor"""
     
-    def __init__(self, temp_dir: str = None, get_workspace_func: Callable = None):
+    def __init__(self, temp_dir: str = None, get_workspace_func: Callable = None,
+                 fsync_scripts: bool = False, script_debounce: float = 0.25,
+                 next_name_func: Callable = None):
         """Initialize the CQ-Editor bridge
         
         Args:
             temp_dir: Optional temporary directory for files
             get_workspace_func: Function to get the current workspace
+            fsync_scripts: Whether to fsync script updates to disk (slower, but
+                survives a system crash)
+            script_debounce: Seconds to coalesce rapid script updates before
+                writing; 0 writes every update immediately
+            next_name_func: Function that takes a prefix and returns an unused
+                object name in the current workspace (optional)
         """
-        self.temp_dir = temp_dir or tempfile.mkdtemp(prefix="cadquery_mcp_")
+        if temp_dir:
+            self.temp_dir = temp_dir
+        else:
+            self.temp_dir = tempfile.mkdtemp(prefix="cadquery_mcp_", dir=_temp_parent_dir())
+            # Reclaim the space (possibly RAM) when the server exits
+            atexit.register(shutil.rmtree, self.temp_dir, ignore_errors=True)
         self.cq_editor_process = None
         self.script_file = os.path.join(self.temp_dir, "current_script.py")
         self.model_file = os.path.join(self.temp_dir, "current_model.step")
         self.screenshots_dir = os.path.join(self.temp_dir, "screenshots")
+        
+        # Prefixes that per-call output paths are appended to
+        self._model_prefix = self.temp_dir + os.sep
+        self._screenshot_prefix = self.screenshots_dir + os.sep + "screenshot_"
         self.get_workspace = get_workspace_func
+        self.next_name = next_name_func
+        self.fsync_scripts = fsync_scripts
+        self.script_debounce = script_debounce
+        
+        # Tools call into the bridge from worker threads
+        self._launch_lock = threading.Lock()
+        self._script_lock = threading.Lock()
+        
+        # Worker threads for model exports, and STL exports still in flight
+        # keyed by model name (finished exports are dropped)
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cq_bridge")
+        self._pending_stl: Dict[str, Future] = {}
+        self._stl_lock = threading.Lock()
+        
+        # Selector reused across launch attempts to wait on the child's stderr
+        self._selector = selectors.DefaultSelector()
+        
+        # Launch command that last started CQ-Editor, and paths known not to work
+        self._resolved_launcher: Optional[List[str]] = None
+        self._failed_launchers: Set[str] = set()
+        
+        # Sequence number for screenshot file names
+        self._screenshot_counter = itertools.count()
+        
+        # Script waiting for the debounce timer to write it
+        self._pending_script: Optional[str] = None
+        self._flush_timer: Optional[threading.Timer] = None
+        
+        # Last script written by update_script, and the file's (size, mtime)
+        # right after writing it, used to skip rewriting identical content
+        self._last_script: Optional[str] = None
+        self._last_script_stat = None
         
         # Create directories
-        os.makedirs(self.screenshots_dir, exist_ok=True)
+        if not os.path.isdir(self.screenshots_dir):
+            os.makedirs(self.screenshots_dir, exist_ok=True)
         
-        # Create empty script file
-        with open(self.script_file, 'w') as f:
-            f.write("import cadquery as cq\n\n# Initial empty script\nresult = cq.Workplane('XY')")
+        # Create empty script file, keeping any script from an earlier session
+        # that shares this temp directory
+        try:
+            with open(self.script_file, 'xb') as f:
+                f.write(b"import cadquery as cq\n\n# Initial empty script\nresult = cq.Workplane('XY')")
+        except FileExistsError:
+            pass
     
     def start_cq_editor(self) -> bool:
         """Start CQ-Editor as a subprocess
@@ -39,55 +158,49 @@ class CQEditorBridge:
         Returns:
             bool: True if successfully started, False otherwise
         """
+        # Concurrent tool calls must not launch two editors
+        with self._launch_lock:
+            return self._start_cq_editor()
+    
+    def _start_cq_editor(self) -> bool:
+        """Start CQ-Editor; the caller holds the launch lock"""
         if self.cq_editor_process and self.cq_editor_process.poll() is None:
             # Already running
             return True
         
+        # Try the command that worked last time before probing the others
+        relaunched = self._resolved_launcher
+        if relaunched is not None:
+            try:
+                if self._launch(relaunched):
+                    return True
+            except Exception as e:
+                print(f"Error relaunching CQ-Editor: {str(e)}")
+            self._resolved_launcher = None
+        
         try:
-            # Define potential paths for CQ-Editor
-            potential_paths = [
-                "cq-editor",  # Default in PATH
-                os.path.join(sys.exec_prefix, 'Scripts', 'cq-editor.exe'),  # Windows conda/pip install
-                os.path.join(sys.exec_prefix, 'python.exe'),  # Python executable for module approach
-                r"C:\Users\Senthil\miniconda3\envs\cadquery\python.exe",  # Your specific environment
-            ]
-            
-            # Try each path
-            for path in potential_paths:
+            # Try each candidate command
+            for argv, pass_script in _LAUNCH_CANDIDATES:
+                path = argv[0]
+                if path in self._failed_launchers:
+                    continue
+                
+                launcher = argv + [self.script_file] if pass_script else argv
+                if launcher == relaunched:
+                    continue
+                
                 try:
-                    if path.endswith('python.exe'):
-                        # Use module approach for Python executable
-                        self.cq_editor_process = subprocess.Popen(
-                            [path, "-m", "cq_editor"],
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.PIPE,
-                            text=True
-                        )
-                    else:
-                        # Direct executable approach
-                        self.cq_editor_process = subprocess.Popen(
-                            [path, self.script_file],
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.PIPE,
-                            text=True
-                        )
-                    
-                    # Wait a bit to ensure it starts properly
-                    time.sleep(2)
-                    
-                    if self.cq_editor_process.poll() is None:
-                        # Process is running
-                        print(f"Successfully launched CQ-Editor using: {path}")
+                    if self._launch(launcher):
+                        self._resolved_launcher = launcher
                         return True
-                    else:
-                        # Process failed to start, try next path
-                        print(f"Failed to launch with {path}, exit code: {self.cq_editor_process.returncode}")
-                        stderr = self.cq_editor_process.stderr.read()
-                        if stderr:
-                            print(f"Error output: {stderr}")
+                except (FileNotFoundError, PermissionError) as e:
+                    # The command can't be spawned at all, so don't try it again.
+                    # Commands that start and then exit may work after the user
+                    # fixes their environment, so those are always retried.
+                    print(f"Error trying path {path}: {str(e)}")
+                    self._failed_launchers.add(path)
                 except Exception as e:
                     print(f"Error trying path {path}: {str(e)}")
-                    continue
             
             # If we get here, all paths failed
             print("All attempts to launch CQ-Editor failed")
@@ -97,6 +210,103 @@ class CQEditorBridge:
             print(f"Unexpected error starting cq-editor: {str(e)}")
             return False
     
+    def _launch(self, launcher: List[str]) -> bool:
+        """Run one launch command and check that CQ-Editor stays up
+        
+        Args:
+            launcher: Command line to run
+            
+        Returns:
+            bool: True if CQ-Editor is running, False if it exited during startup
+        
+        Raises whatever subprocess.Popen raises if the command can't be spawned.
+        """
+        path = launcher[0]
+        
+        # Only stderr is kept, for reporting failures. Leaving it as raw bytes
+        # and discarding stdout avoids text wrappers and an extra pipe. CPython
+        # only uses posix_spawn when close_fds is off, which is safe because
+        # descriptors are non-inheritable by default (PEP 446).
+        self.cq_editor_process = subprocess.Popen(
+            launcher,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            close_fds=False
+        )
+        
+        # Wait until it either exits or survives the timeout
+        running, startup_output = self._wait_for_startup()
+        if running:
+            # Process is running
+            print(f"Successfully launched CQ-Editor using: {path}")
+            # Keep reading stderr so the long-running child can never block
+            # on a full pipe buffer
+            _start_drain(self.cq_editor_process.stderr)
+            return True
+        
+        # Process failed to start
+        print(f"Failed to launch with {path}, exit code: {self.cq_editor_process.returncode}")
+        # The process has exited, but a grandchild could still hold the pipes
+        # open, so don't wait on them indefinitely
+        try:
+            _, stderr = self.cq_editor_process.communicate(timeout=1.0)
+        except subprocess.TimeoutExpired:
+            self.cq_editor_process.kill()
+            _, stderr = self.cq_editor_process.communicate()
+        stderr = startup_output + (stderr or b"")
+        if stderr:
+            print(f"Error output: {stderr.decode(errors='replace')}")
+        return False
+    
+    def _wait_for_startup(self, timeout: float = 2.0) -> Tuple[bool, bytes]:
+        """Wait for a freshly launched CQ-Editor to settle
+        
+        Waits on the child's stderr pipe, which reaches end-of-file the moment
+        the process exits, so a failed launch is detected immediately instead
+        of after a fixed sleep. Output read while waiting is returned so it
+        can still be reported.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            tuple: (True if the process is still running, stderr read so far)
+        """
+        process = self.cq_editor_process
+        deadline = time.monotonic() + timeout
+        output = bytearray()
+        
+        if sys.platform == "win32":
+            # select() only supports sockets on Windows, so poll instead
+            while process.poll() is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                time.sleep(min(remaining, 0.05))
+            return process.poll() is None, bytes(output)
+        
+        fd = process.stderr.fileno()
+        self._selector.register(fd, selectors.EVENT_READ)
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._selector.select(timeout=remaining):
+                    break
+                
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    # stderr was closed, which normally means the child exited
+                    try:
+                        process.wait(timeout=max(deadline - time.monotonic(), 0))
+                    except subprocess.TimeoutExpired:
+                        pass
+                    break
+                output += chunk
+        finally:
+            self._selector.unregister(fd)
+        
+        return process.poll() is None, bytes(output)
+    
     def stop_cq_editor(self) -> bool:
         """Stop the CQ-Editor process
         
@@ -121,19 +331,85 @@ class CQEditorBridge:
     def update_script(self, script_content: str) -> bool:
         """Update the script file that CQ-Editor is using
         
+        Updates arriving within script_debounce seconds of each other are
+        coalesced, so only the latest script is written and CQ-Editor doesn't
+        reload every intermediate version.
+        
         Args:
             script_content: CadQuery Python script content
             
         Returns:
-            bool: True if successfully updated, False otherwise
+            bool: True if the update was accepted (or, without debouncing,
+                written), False otherwise
         """
+        if self.script_debounce <= 0:
+            with self._script_lock:
+                self._pending_script = script_content
+            return self.flush_script()
+        
+        with self._script_lock:
+            self._pending_script = script_content
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.script_debounce, self.flush_script)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        return True
+    
+    def flush_script(self) -> bool:
+        """Write any pending script update to the script file now
+        
+        Returns:
+            bool: True if nothing was pending or the write succeeded, False otherwise
+        """
+        with self._script_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            
+            script_content = self._pending_script
+            self._pending_script = None
+            if script_content is None:
+                return True
+            
+            try:
+                # Skip the write if the file still holds exactly what we last wrote
+                if script_content == self._last_script and self._script_file_stat() == self._last_script_stat:
+                    return True
+                
+                self._write_script_file(script_content.encode("utf-8"))
+                self._last_script = script_content
+                self._last_script_stat = self._script_file_stat()
+                return True
+            except Exception as e:
+                print(f"Error updating script: {str(e)}")
+                return False
+    
+    def _script_file_stat(self):
+        """Get the (size, mtime) of the script file, or None if it's missing"""
         try:
-            with open(self.script_file, 'w') as f:
-                f.write(script_content)
-            return True
-        except Exception as e:
-            print(f"Error updating script: {str(e)}")
-            return False
+            st = os.stat(self.script_file)
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime_ns
+    
+    def _write_script_file(self, data: bytes):
+        """Write pre-encoded script content to the script file
+        
+        The content goes to a sibling temp file that is then renamed over the
+        script, so CQ-Editor never sees a partially written script.
+        """
+        tmp_file = self.script_file + ".tmp"
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+            if self.fsync_scripts:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_file, self.script_file)
     
     def get_screenshot(self) -> str:
         """Take a screenshot of CQ-Editor (mock implementation)
@@ -149,15 +425,86 @@ class CQEditorBridge:
         # screenshot = pyautogui.screenshot("window_title='CadQuery Editor'")
         
         # For now, we'll just create a simple text file as a placeholder
-        timestamp = int(time.time())
-        screenshot_path = os.path.join(self.screenshots_dir, f"screenshot_{timestamp}.png")
-        
-        # In a real implementation, you'd save an actual screenshot here
-        with open(screenshot_path, 'w') as f:
-            f.write("Mock screenshot file")
+        # In a real implementation, you'd save an actual screenshot here.
+        # O_EXCL never overwrites an existing file, so names already taken by
+        # an earlier bridge sharing this temp directory are skipped.
+        while True:
+            index = next(self._screenshot_counter)
+            screenshot_path = f"{self._screenshot_prefix}{index:08d}.png"
+            try:
+                fd = os.open(screenshot_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+                break
+            except FileExistsError:
+                continue
+        try:
+            os.write(fd, b"Mock screenshot file")
+        finally:
+            os.close(fd)
         
         return screenshot_path
     
+    def get_stl_path(self, name: str) -> str:
+        """Get the STL file saved alongside a model, waiting for it if needed
+        
+        Args:
+            name: Name the model was saved under
+            
+        Returns:
+            str: Path to the STL file, or empty string if it wasn't saved
+        """
+        with self._stl_lock:
+            future = self._pending_stl.get(name)
+        if future is not None:
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Error saving STL for {name}: {str(e)}", file=sys.stderr)
+                return ""
+        
+        stl_file = f"{self._model_prefix}{name}.stl"
+        return stl_file if os.path.exists(stl_file) else ""
+    
+    def _queue_stl(self, name: str, object_data: Any = None):
+        """Export a model's STL in the background
+        
+        Exports under the same name run in order, and each is written to a
+        temp file and renamed into place. A failed export, or object_data of
+        None, removes the name's STL so get_stl_path never returns a file
+        from an earlier save.
+        """
+        stl_file = f"{self._model_prefix}{name}.stl"
+        
+        with self._stl_lock:
+            previous = self._pending_stl.get(name)
+            
+            def run():
+                if previous is not None:
+                    wait([previous])
+                if object_data is None:
+                    if os.path.exists(stl_file):
+                        os.remove(stl_file)
+                    return
+                
+                tmp_file = stl_file + ".tmp"
+                try:
+                    object_data.exportStl(tmp_file)
+                    os.replace(tmp_file, stl_file)
+                except BaseException:
+                    for path in (tmp_file, stl_file):
+                        if os.path.exists(path):
+                            os.remove(path)
+                    raise
+            
+            future = self._executor.submit(run)
+            self._pending_stl[name] = future
+        
+        def forget(f):
+            with self._stl_lock:
+                if self._pending_stl.get(name) is f:
+                    del self._pending_stl[name]
+        
+        future.add_done_callback(forget)
+    
     def save_model(self, object_data: Any, name: str) -> str:
         """Save a CadQuery model to a file
         
@@ -173,72 +520,137 @@ class CQEditorBridge:
                 print("Object doesn't support STEP export")
                 return ""
                 
+            step_file = f"{self._model_prefix}{name}.step"
+            
             # Save as STEP
-            step_file = os.path.join(self.temp_dir, f"{name}.step")
             object_data.exportStep(step_file)
-            
-            # Also save as STL for compatibility
-            stl_file = os.path.join(self.temp_dir, f"{name}.stl")
-            object_data.exportStl(stl_file)
-            
-            return step_file
         except Exception as e:
             print(f"Error saving model: {str(e)}")
+            # Don't leave an earlier save's STL behind for this name
+            self._queue_stl(name)
             return ""
+        
+        # Also save as STL for compatibility. Tessellation is the expensive
+        # part and most callers only need STEP, so it runs in the background;
+        # use get_stl_path to wait for it. It starts only once the STEP export
+        # is done, since meshing writes into the faces that export reads.
+        self._queue_stl(name, object_data)
+        
+        return step_file
+
+def _probe_directory(dir_path: str):
+    """Check whether a directory exists and find CQ-Editor entries in it
+    
+    Returns:
+        tuple: (dir_path, exists, paths of entries that look like CQ-Editor)
+    """
+    found = []
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                name = entry.name.lower()
+                if "cq" in name and "editor" in name:
+                    found.append(entry.path)
+    except OSError:
+        return dir_path, os.path.isdir(dir_path), found
+    return dir_path, True, found
+
+def _start_drain(stream):
+    """Discard everything written to a pipe on a background thread"""
+    def drain():
+        try:
+            for _ in stream:
+                pass
+        except Exception:
+            pass
+    
+    threading.Thread(target=drain, daemon=True).start()
+
+def _diagnose_cq_editor() -> dict:
+    """Diagnose CQ-Editor installation and find path"""
+    results = {
+        "python_executable": sys.executable,
+        "conda_environment": os.environ.get("CONDA_DEFAULT_ENV", "None"),
+        "searched_paths": []
+    }
+    
+    # Search for cq-editor in common locations
+    search_paths = [
+        os.path.join(sys.exec_prefix, 'Scripts'),
+        os.path.join(sys.exec_prefix, 'bin'),
+        r"C:\Users\Senthil\miniconda3\envs\cadquery\Scripts",
+    ]
+    
+    # Probe the directories concurrently; they may be on slow filesystems
+    with ThreadPoolExecutor(max_workers=len(search_paths)) as executor:
+        for dir_path, exists, found in executor.map(_probe_directory, search_paths):
+            results["searched_paths"].append({"path": dir_path, "exists": exists})
+            for path in found:
+                results["searched_paths"].append(f"Found: {path}")
+    
+    # Try to find the module
+    try:
+        import importlib.util
+        cq_editor_spec = importlib.util.find_spec("cq_editor")
+        if cq_editor_spec:
+            results["cq_editor_module"] = cq_editor_spec.origin
+    except:
+        results["cq_editor_module"] = "Error finding module"
+    
+    return results
+
+# Shared executor for the blocking work behind the bridge's MCP tools
+_tool_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cq_editor_tool")
+
+async def _run_blocking(func, *args):
+    """Run a blocking call on the tool executor without stalling the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_tool_executor, func, *args)
+
+def _read_script(path: str) -> str:
+    """Read a script file written as UTF-8"""
+    # Read the raw bytes in one call and decode once
+    with open(path, 'rb') as f:
+        return f.read().decode("utf-8")
+
+# Bridge shared by every integrate_with_mcp_server call in this process
+_BRIDGE: Optional[CQEditorBridge] = None
 
 # Example of using the bridge from your MCP server
-def integrate_with_mcp_server(mcp, get_workspace_func):
+def integrate_with_mcp_server(mcp, get_workspace_func, next_name_func=None):
     """
     Example of how to integrate the bridge with your MCP server
     
     Args:
         mcp: The FastMCP server instance
         get_workspace_func: Function to get the current workspace
+        next_name_func: Function that takes a prefix and returns an unused
+            object name in the current workspace (optional)
     """
-    # Create a new temp directory
-    temp_dir = tempfile.mkdtemp(prefix="cadquery_mcp_")
+    global _BRIDGE
     
-    # Initialize the bridge
-    bridge = CQEditorBridge(temp_dir=temp_dir, get_workspace_func=get_workspace_func)
+    # Share one bridge per process, so calling this again (e.g. on reconnect)
+    # doesn't orphan the previous bridge's temp directory and editor process
+    if _BRIDGE is None:
+        _BRIDGE = CQEditorBridge(get_workspace_func=get_workspace_func,
+                                 next_name_func=next_name_func)
+        atexit.register(_BRIDGE.stop_cq_editor)
+        atexit.register(_BRIDGE.flush_script)
+    else:
+        # Tools registered by this call must see this caller's workspaces
+        _BRIDGE.get_workspace = get_workspace_func
+        _BRIDGE.next_name = next_name_func
+    bridge = _BRIDGE
 
     @mcp.tool()
-    def diagnose_cq_editor() -> dict:
+    async def diagnose_cq_editor() -> dict:
         """Diagnose CQ-Editor installation and find path"""
-        results = {
-            "python_executable": sys.executable,
-            "conda_environment": os.environ.get("CONDA_DEFAULT_ENV", "None"),
-            "searched_paths": []
-        }
-        
-        # Search for cq-editor in common locations
-        search_paths = [
-            os.path.join(sys.exec_prefix, 'Scripts'),
-            os.path.join(sys.exec_prefix, 'bin'),
-            r"C:\Users\Senthil\miniconda3\envs\cadquery\Scripts",
-        ]
-        
-        for dir_path in search_paths:
-            results["searched_paths"].append({"path": dir_path, "exists": os.path.exists(dir_path)})
-            if os.path.exists(dir_path):
-                for file in os.listdir(dir_path):
-                    if "cq" in file.lower() and "editor" in file.lower():
-                        results["searched_paths"].append(f"Found: {os.path.join(dir_path, file)}")
-        
-        # Try to find the module
-        try:
-            import importlib.util
-            cq_editor_spec = importlib.util.find_spec("cq_editor")
-            if cq_editor_spec:
-                results["cq_editor_module"] = cq_editor_spec.origin
-        except:
-            results["cq_editor_module"] = "Error finding module"
-        
-        return results
+        return await _run_blocking(_diagnose_cq_editor)
     
     @mcp.tool()
-    def launch_cq_editor() -> dict:
+    async def launch_cq_editor() -> dict:
         """Launch the CadQuery Editor UI"""
-        success = bridge.start_cq_editor()
+        success = await _run_blocking(bridge.start_cq_editor)
         
         if success:
             return {
@@ -252,9 +664,9 @@ def integrate_with_mcp_server(mcp, get_workspace_func):
             }
     
     @mcp.tool()
-    def close_cq_editor() -> dict:
+    async def close_cq_editor() -> dict:
         """Close the CadQuery Editor UI"""
-        success = bridge.stop_cq_editor()
+        success = await _run_blocking(bridge.stop_cq_editor)
         
         if success:
             return {
@@ -268,13 +680,13 @@ def integrate_with_mcp_server(mcp, get_workspace_func):
             }
     
     @mcp.tool()
-    def update_cq_script(script: str) -> dict:
+    async def update_cq_script(script: str) -> dict:
         """Update the script in CadQuery Editor
         
         Args:
             script: CadQuery Python script content
         """
-        success = bridge.update_script(script)
+        success = await _run_blocking(bridge.update_script, script)
         
         if success:
             return {
@@ -289,7 +701,7 @@ def integrate_with_mcp_server(mcp, get_workspace_func):
             }
     
     @mcp.tool()
-    def sync_object_from_editor(name: str = None) -> dict:
+    async def sync_object_from_editor(name: str = None) -> dict:
         """Sync the current object from CQ-Editor to the MCP server
         
         This retrieves the current model from CQ-Editor and stores it in the workspace.
@@ -302,19 +714,21 @@ def integrate_with_mcp_server(mcp, get_workspace_func):
                 "status": "error",
                 "message": "Workspace management function not provided to bridge"
             }
-            
-        workspace = bridge.get_workspace()
-        
-        if name is None:
-            name = f'synced_{len(workspace["objects"])}'
         
         try:
+            if name is None:
+                if bridge.next_name is not None:
+                    name = bridge.next_name("synced")
+                else:
+                    workspace = bridge.get_workspace()
+                    name = f'synced_{len(workspace["objects"])}'
+            
             # In a real implementation, you would need a way to communicate with CQ-Editor
             # to retrieve the current model. This is a simplified mock implementation.
             
-            # Read the current script
-            with open(bridge.script_file, 'r') as f:
-                script = f.read()
+            # Read the current script, including any update still debouncing
+            await _run_blocking(bridge.flush_script)
+            script = await _run_blocking(_read_script, bridge.script_file)
             
             # Here you would execute the script to get the result
             # This is a simplified example - in reality you'd need to handle